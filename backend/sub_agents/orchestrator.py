@@ -1,42 +1,64 @@
 import logging
 from google.adk.agents import Agent, InvocationContext
 from google.adk.events import Event
-from typing import AsyncGenerator
+from pydantic import Field, PrivateAttr
+from typing import Any, AsyncGenerator, ClassVar
 
 logger = logging.getLogger(__name__)
 
-def is_empty_text_event(event) -> bool:
-    """Check if this is an empty text event that would crash AG-UI."""
-    # Check if it's a tool call/response - those are fine
-    if event.get_function_calls() or event.get_function_responses():
+def is_empty_text_event(event, calls=None) -> bool:
+    """Check if this is an empty text event that would crash AG-UI.
+
+    This runs once per streamed chunk, so it avoids repeated hasattr probes
+    and allocating the function-call lists more than once. Callers that
+    already fetched event.get_function_calls() can pass it as `calls` to
+    skip rebuilding the list.
+    """
+    # Tool calls/responses are fine - check each list only once
+    if calls is None:
+        calls = event.get_function_calls()
+    if calls or event.get_function_responses():
         return False
-    
-    # Check content attribute
-    if hasattr(event, 'content'):
-        content = event.content
-        if content is not None:
-            # If content is a string
-            if isinstance(content, str):
-                return content.strip() == ""
-            # If content has parts
-            if hasattr(content, 'parts'):
-                for part in content.parts:
-                    if hasattr(part, 'text') and part.text and part.text.strip():
-                        return False
-                return True  # All parts empty
-    
-    # Check text attribute directly  
-    if hasattr(event, 'text'):
-        text = event.text
-        if text is not None and isinstance(text, str):
-            return text.strip() == ""
-    
+
+    content = getattr(event, 'content', None)
+    if content is not None:
+        # If content is a string
+        if isinstance(content, str):
+            return content.strip() == ""
+        # If content has parts, it's empty only when no part has visible text
+        parts = getattr(content, 'parts', None)
+        if parts is not None:
+            return not any(
+                getattr(part, 'text', None) and not part.text.isspace()
+                for part in parts
+            )
+
+    # Check text attribute directly
+    text = getattr(event, 'text', None)
+    if isinstance(text, str):
+        return text.strip() == ""
+
     return False  # Not a text event or couldn't determine
 
 class OrchestratorAgent(Agent):
-    profile_agent: Agent
-    finder_agent: Agent  # Combined scout + validator
-    writer_agent: Agent
+    # repr=False keeps ADK's logging of the root agent from dumping the full
+    # sub-agent trees (instructions included) every time it's formatted
+    profile_agent: Agent = Field(repr=False)
+    finder_agent: Agent = Field(repr=False)  # Combined scout + validator
+    writer_agent: Agent = Field(repr=False)
+
+    # Bound run_async methods, cached once at init so the step handlers skip
+    # the self.<agent>.run_async attribute chain on every turn. PrivateAttr
+    # keeps these out of pydantic validation/serialization.
+    _profile_run: Any = PrivateAttr(default=None)
+    _finder_run: Any = PrivateAttr(default=None)
+    _writer_run: Any = PrivateAttr(default=None)
+
+    def model_post_init(self, __context) -> None:
+        super().model_post_init(__context)
+        self._profile_run = self.profile_agent.run_async
+        self._finder_run = self.finder_agent.run_async
+        self._writer_run = self.writer_agent.run_async
 
     # NOTE: We intentionally do NOT set self.sub_agents here.
     # If we did, ADK would auto-route subsequent messages directly to sub-agents,
@@ -51,22 +73,27 @@ class OrchestratorAgent(Agent):
         """
         if not profile or not isinstance(profile, dict):
             return False
-        
-        # Minimum required fields for a complete profile
-        has_name = bool(profile.get("name"))
-        has_location = bool(profile.get("location", {}).get("state") or profile.get("location", {}).get("city"))
-        has_needs = bool(profile.get("needs"))
-        
-        # Profile is complete if it has name, some location, and needs
-        is_complete = has_name and has_location and has_needs
-        logger.debug(f"Profile check: name={has_name}, loc={has_location}, needs={has_needs} => {is_complete}")
-        return is_complete
+
+        # Minimum required fields: name, some location, and needs.
+        # Short-circuit on the first missing field and look up "location"
+        # only once (this check runs up to twice per request).
+        if not profile.get("name"):
+            logger.debug("Profile check: missing name")
+            return False
+        location = profile.get("location") or {}
+        if not (location.get("state") or location.get("city")):
+            logger.debug("Profile check: missing location")
+            return False
+        if not profile.get("needs"):
+            logger.debug("Profile check: missing needs")
+            return False
+        return True
 
     async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
         state = ctx.session.state
         
         workflow_step = state.get("workflow_step", "profile_building")
-        logger.debug(f"Request received - workflow: {workflow_step}")
+        logger.debug("Request received - workflow: %s", workflow_step)
         
         # Get profile from state - this persists across requests via AG-UI session
         civic_grant_profile = state.get("civic_grant_profile", {})
@@ -76,9 +103,12 @@ class OrchestratorAgent(Agent):
         profile_is_actually_complete = self._check_profile_completeness(civic_grant_profile)
         
         # Also check for profile set by profile_agent during this session
-        department_profile = state.get("department_profile", {})
-        if not profile_is_actually_complete and department_profile:
-            profile_is_actually_complete = self._check_profile_completeness(department_profile)
+        # (only looked up when needed, skipping it - and the second check -
+        # when it's literally the same dict we just checked)
+        if not profile_is_actually_complete:
+            department_profile = state.get("department_profile")
+            if department_profile and department_profile is not civic_grant_profile:
+                profile_is_actually_complete = self._check_profile_completeness(department_profile)
         
         # Determine workflow step based on actual profile state
         # (workflow_step already retrieved above)
@@ -90,110 +120,138 @@ class OrchestratorAgent(Agent):
             state["workflow_step"] = "grant_scouting"
             state["profile_complete"] = True
 
-        # ==================================================================
-        # STEP 1: PROFILE BUILDING
-        # ==================================================================
-        if workflow_step == "profile_building":
-            profile_just_finished = False
-            async for event in self.profile_agent.run_async(ctx):
-                # FIX: Filter out empty text events to prevent AG-UI crash
-                if is_empty_text_event(event):
-                    continue
-                
-                # Check for explicit Exit Tool usage
-                if event.get_function_calls():
-                    for call in event.get_function_calls():
-                        if call.name == "exit_profile_loop":
-                            # Force the state update right here if the tool didn't stick
-                            ctx.session.state["profile_complete"] = True
-                            profile_just_finished = True
+        # Dispatch to the handler for the current workflow step (single dict
+        # lookup instead of an if/elif chain over string literals)
+        handler = self._STEP_HANDLERS.get(workflow_step)
+        if handler is None:
+            logger.warning("Unknown workflow_step: %s", workflow_step)
+            return
 
-                yield event
-                
-                # Check state after every yield
-                if ctx.session.state.get("profile_complete"):
+        async for event in handler(self, ctx):
+            yield event
+
+    async def _stream_filtered(self, agent_run, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        """Stream a sub-agent's events, dropping empty text events.
+
+        Shared by the handlers that pass events straight through; the
+        profile and writer handlers keep their own loops because they do
+        extra per-event work.
+        """
+        async for event in agent_run(ctx):
+            if is_empty_text_event(event):
+                continue
+            yield event
+
+    # ==================================================================
+    # STEP 1: PROFILE BUILDING
+    # ==================================================================
+    async def _handle_profile_building(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state
+        profile_just_finished = False
+        async for event in self._profile_run(ctx):
+            # Fetch the function-call list once per event; the ADK accessor
+            # walks content.parts and builds a new list on every call
+            calls = event.get_function_calls()
+
+            # FIX: Filter out empty text events to prevent AG-UI crash
+            if is_empty_text_event(event, calls):
+                continue
+
+            # Check for explicit Exit Tool usage
+            for call in calls:
+                if call.name == "exit_profile_loop":
+                    # Force the state update right here if the tool didn't stick
+                    state["profile_complete"] = True
                     profile_just_finished = True
 
-            # TRANSITION LOGIC - Set state but DON'T auto-run finder
-            # Let the user send a new message like "find grants" to trigger finder
-            if profile_just_finished or ctx.session.state.get("profile_complete"):
-                state["workflow_step"] = "grant_scouting"
-                
-                # Ensure the profile is available in the key 'civic_grant_profile'
-                if "civic_grant_profile" not in ctx.session.state:
-                    ctx.session.state["civic_grant_profile"] = ctx.session.state.get("department_profile", {})
-                
-                # DON'T auto-run finder here - the exit_profile_loop tool tells user to say "find grants"
-                return
-            else:
-                return
-
-        # ==================================================================
-        # STEP 2: GRANT FINDING (combined scout + validation)
-        # ==================================================================
-        elif workflow_step == "grant_scouting":
-            # Run finder agent - searches and validates grants
-            async for event in self.finder_agent.run_async(ctx):
-                # Allow all events through (text + tool calls)
-                if is_empty_text_event(event):
-                    continue
+            yield event
+
+        # TRANSITION LOGIC - Set state but DON'T auto-run finder
+        # Let the user send a new message like "find grants" to trigger finder
+        if profile_just_finished or state.get("profile_complete"):
+            state["workflow_step"] = "grant_scouting"
+
+            # Ensure the profile is available in the key 'civic_grant_profile'
+            if "civic_grant_profile" not in state:
+                state["civic_grant_profile"] = state.get("department_profile", {})
+
+            # DON'T auto-run finder here - the exit_profile_loop tool tells user to say "find grants"
+
+    # ==================================================================
+    # STEP 2: GRANT FINDING (combined scout + validation)
+    # ==================================================================
+    async def _handle_grant_scouting(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        # Run finder agent - searches and validates grants
+        # (all non-empty events pass through: text + tool calls)
+        async for event in self._stream_filtered(self._finder_run, ctx):
+            yield event
+
+        # Ensure workflow advances (tool should have set this, but double-check)
+        state = ctx.session.state
+        if state.get("workflow_step") != "awaiting_grant_selection":
+            state["workflow_step"] = "awaiting_grant_selection"
+
+    # ==================================================================
+    # STEP 3.5: AWAITING GRANT SELECTION (idle state)
+    # ==================================================================
+    async def _handle_awaiting_grant_selection(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        # Check if user has selected a grant
+        state = ctx.session.state
+        selected_grant = state.get("selected_grant_for_writing")
+
+        if selected_grant:
+            state["workflow_step"] = "grant_writing"
+
+            # Immediately transition to grant writing
+            async for event in self._stream_filtered(self._writer_run, ctx):
                 yield event
-            
-            # Ensure workflow advances (tool should have set this, but double-check)
-            if ctx.session.state.get("workflow_step") != "awaiting_grant_selection":
-                ctx.session.state["workflow_step"] = "awaiting_grant_selection"
-            
-            return
 
-        # ==================================================================
-        # STEP 3.5: AWAITING GRANT SELECTION (idle state)
-        # ==================================================================
-        elif workflow_step == "awaiting_grant_selection":
-            # Check if user has selected a grant
-            selected_grant = ctx.session.state.get("selected_grant_for_writing")
-            
-            if selected_grant:
-                ctx.session.state["workflow_step"] = "grant_writing"
-                
-                # Immediately transition to grant writing
-                async for event in self.writer_agent.run_async(ctx):
-                    if is_empty_text_event(event):
-                        continue
-                    yield event
-            
-            return
+    # ==================================================================
+    # STEP 4: GRANT WRITING
+    # ==================================================================
+    async def _handle_grant_writing(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        # The grant writer uses save_grant_draft tool to save draft to state
+        # We just need to pass through events and suppress the draft text from chat
+        async for event in self._writer_run(ctx):
+            # Tool calls/responses pass through untouched
+            if event.get_function_calls() or event.get_function_responses():
+                yield event
+                continue
+
+            # Text event: one walk over parts decides both the empty-event
+            # filter (AG-UI crashes on empty text) and draft suppression,
+            # checking raw lengths so we never strip() a multi-KB chunk
+            # just to measure it.
+            has_visible_text = False
+            total_len = 0
+            content = getattr(event, 'content', None)
+            parts = getattr(content, 'parts', None) if content else None
+            if parts:
+                for part in parts:
+                    text = getattr(part, 'text', None)
+                    if text:
+                        if not text.isspace():
+                            has_visible_text = True
+                        total_len += len(text)
+                        if has_visible_text and total_len >= 200:
+                            break
 
-        # ==================================================================
-        # STEP 4: GRANT WRITING
-        # ==================================================================
-        elif workflow_step == "grant_writing":
-            # The grant writer uses save_grant_draft tool to save draft to state
-            # We just need to pass through events and suppress the draft text from chat
-            async for event in self.writer_agent.run_async(ctx):
-                if is_empty_text_event(event):
-                    continue
-                
-                # Check if this is a text event - suppress draft content from chat
-                has_text = False
-                event_text = ""
-                if hasattr(event, 'content') and event.content:
-                    if hasattr(event.content, 'parts'):
-                        for part in event.content.parts:
-                            if hasattr(part, 'text') and part.text:
-                                has_text = True
-                                event_text = part.text
-                                break
-                
-                if has_text:
-                    # Only yield short messages (acknowledgements), suppress long draft text
-                    if len(event_text.strip()) < 200:
-                        yield event
-                else:
-                    # Non-text events (tool calls, tool responses) pass through
+                if not has_visible_text:
+                    continue  # empty text event - would crash AG-UI
+
+                # Only yield short messages (acknowledgements), suppress long draft text
+                if total_len < 200:
+                    yield event
+            else:
+                # Non-text events pass through
+                if not is_empty_text_event(event, ()):
                     yield event
-            
-            return
 
-        else:
-            logger.warning(f"Unknown workflow_step: {workflow_step}")
-            return
+    # Workflow step -> handler. Unknown steps fall through to a warning in
+    # _run_async_impl. Declared after the handlers so the names resolve.
+    _STEP_HANDLERS: ClassVar[dict] = {
+        "profile_building": _handle_profile_building,
+        "grant_scouting": _handle_grant_scouting,
+        "awaiting_grant_selection": _handle_awaiting_grant_selection,
+        "grant_writing": _handle_grant_writing,
+    }
@@ -8,18 +8,9 @@ from tools.web_search import search_web
 from tools.profile_tools import updateDepartmentProfile, exit_profile_loop, on_before_agent
 import os
 
-
-def create_profile_collector_agent(retry_config: types.HttpRetryOptions) -> LlmAgent:
-    return LlmAgent(
-        name="ProfileCollector",
-        model=Gemini(
-            model=os.getenv("GEMINI_MODEL", "gemini-2.0-flash"),
-            retry_options=retry_config
-        ),
-        tools=[exit_profile_loop, search_web, updateDepartmentProfile],
-        before_agent_callback=on_before_agent,
-        
-        instruction="""You are the ProfileCollector agent - a friendly intake specialist who helps public safety organizations and non-profits provide their information for grant finding.
+# Static instruction block, bound once at import. Keeping the prompt byte-
+# identical across turns also lets the Gemini backend reuse its prefix cache.
+_INSTRUCTION = """You are the ProfileCollector agent - a friendly intake specialist who helps public safety organizations and non-profits provide their information for grant finding.
 
 **Supported Organization Types:**
 - Fire Departments (volunteer, paid, combination)
@@ -95,6 +86,18 @@ When you have: Name, Type, Location (City, State, County), Budget, Needs, Stats,
 6. Service Stats (Calls, Active Members)
 7. Mission
 
-""",
+"""
+
+
+def create_profile_collector_agent(retry_config: types.HttpRetryOptions) -> LlmAgent:
+    return LlmAgent(
+        name="ProfileCollector",
+        model=Gemini(
+            model=os.getenv("GEMINI_MODEL", "gemini-2.0-flash"),
+            retry_options=retry_config
+        ),
+        tools=[exit_profile_loop, search_web, updateDepartmentProfile],
+        before_agent_callback=on_before_agent,
+        instruction=_INSTRUCTION,
         output_key="profile_agent_response",
     )
\ No newline at end of file
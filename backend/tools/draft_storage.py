@@ -1,10 +1,15 @@
 """Draft Storage Tools - ADK tool wrappers for saving grant drafts to state"""
 
 import logging
+import re
 from google.adk.tools.tool_context import ToolContext
 
 logger = logging.getLogger(__name__)
 
+# Matches one or two backslashes before an 'n' - the LLM sometimes passes
+# literal \n (or double-escaped \\n) instead of actual newlines
+_ESCAPED_NEWLINE_RE = re.compile(r'\\{1,2}n')
+
 
 def save_grant_draft(tool_context: ToolContext, grant_name: str, draft_content: str):
     """
@@ -14,17 +19,22 @@ def save_grant_draft(tool_context: ToolContext, grant_name: str, draft_content:
         grant_name: The name of the grant this application is for
         draft_content: The full markdown content of the grant application draft
     """
-    # Fix escaped newlines - LLM sometimes passes literal \n instead of actual newlines
-    cleaned_content = draft_content.replace('\\n', '\n')
-    
-    # Also fix double-escaped newlines
-    cleaned_content = cleaned_content.replace('\\\\n', '\n')
+    # Fix escaped (and double-escaped) newlines in a single pass instead of
+    # two full-copy replace() scans over the draft
+    cleaned_content = _ESCAPED_NEWLINE_RE.sub('\n', draft_content)
     
-    # Save the draft to state - this will sync to frontend
-    tool_context.state["grant_draft"] = cleaned_content
-    tool_context.state["grant_draft_for_display"] = cleaned_content
-    tool_context.state["workflow_step"] = "draft_ready"
-    tool_context.state["grant_name_for_draft"] = grant_name
+    # Save the draft to state - this will sync to frontend. Skip the writes
+    # when the value is unchanged (the LLM occasionally re-calls this tool
+    # with the same draft) so we don't re-serialize a multi-KB draft to the
+    # client for nothing.
+    state = tool_context.state
+    if state.get("grant_draft") != cleaned_content:
+        state["grant_draft"] = cleaned_content
+        state["grant_draft_for_display"] = cleaned_content
+    if state.get("workflow_step") != "draft_ready":
+        state["workflow_step"] = "draft_ready"
+    if state.get("grant_name_for_draft") != grant_name:
+        state["grant_name_for_draft"] = grant_name
     
     logger.info(f"Grant draft saved for: {grant_name}")
     return f"DONE. Draft for {grant_name} saved successfully. Do not call this tool again. Say: 'Your draft is ready! 👈 Check the left panel to review it.'"
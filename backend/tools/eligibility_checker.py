@@ -5,16 +5,42 @@ Validates whether a department is eligible for a specific grant.
 
 import logging
 import re
+import time
+from collections import deque
 from typing import Dict, Any, List
 from dataclasses import dataclass
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Keyword matchers for the _check_* methods - one compiled alternation per
+# category means one C-level scan of the grant text instead of a Python
+# loop of substring probes (same pattern as grant_filters)
+def _keyword_re(keywords) -> "re.Pattern":
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
 
-@dataclass
+
+_VOLUNTEER_RE = _keyword_re(("volunteer", "combination", "all fire departments", "any fire department"))
+_PAID_ONLY_RE = _keyword_re(("paid", "career", "full-time staff"))
+_FEDERAL_RE = _keyword_re(("federal", "fema", "national", "nationwide"))
+_EQUIPMENT_RE = _keyword_re(("equipment", "apparatus", "vehicle", "scba", "gear", "aed", "extrication"))
+_TRAINING_RE = _keyword_re(("training", "education", "certification", "professional development"))
+_FACILITY_RE = _keyword_re(("facility", "station", "building", "construction", "renovation"))
+
+# Need strings are a few words long - plain tuple scans are fine there
+_TRAINING_NEED_HINTS = ("training", "certification", "education")
+_EQUIPMENT_NEED_HINTS = ("equipment", "gear", "scba", "aed")
+_FACILITY_NEED_HINTS = ("facility", "station", "building")
+
+# Dollar amounts in free-text funding ranges like "$10,000 - $100,000".
+# Compiled once; the translate table strips '$' and ',' in one C-level pass
+_FUNDING_AMOUNT_RE = re.compile(r'\$?[\d,]+')
+_AMOUNT_STRIP = str.maketrans('', '', '$,')
+
+
+@dataclass(slots=True, frozen=True)
 class EligibilityResult:
-    """Result of an eligibility check."""
+    """Result of an eligibility check. Immutable once built."""
     is_eligible: bool
     score: float  # 0.0 to 1.0
     reasons: List[str]
@@ -30,7 +56,8 @@ class EligibilityChecker:
 
     def __init__(self):
         """Initialize the eligibility checker."""
-        self.check_history = []
+        # Bounded so a long-lived checker can't grow without limit
+        self.check_history = deque(maxlen=10_000)
 
     def check_eligibility(
         self,
@@ -47,15 +74,19 @@ class EligibilityChecker:
         Returns:
             EligibilityResult with eligibility status and details
         """
-        logger.info(f"Checking eligibility for grant: {grant_info.get('name', 'Unknown')}")
+        logger.info("Checking eligibility for grant: %s", grant_info.get('name', 'Unknown'))
 
         reasons = []
         warnings = []
         match_details = {}
         score = 0.0
 
+        # Lower the description+name blob once - three of the five checks
+        # scan it, and each used to rebuild and re-lower it independently
+        grant_text = (grant_info.get("description", "") + " " + grant_info.get("name", "")).lower()
+
         # Check 1: Organization Type
-        type_score = self._check_organization_type(grant_info, department_profile)
+        type_score = self._check_organization_type(grant_text, department_profile)
         score += type_score * 0.25
         if type_score > 0.5:
             reasons.append(f"Organization type matches: {department_profile.get('type')}")
@@ -75,7 +106,7 @@ class EligibilityChecker:
             match_details["location_match"] = False
 
         # Check 3: Needs Alignment
-        needs_score = self._check_needs_alignment(grant_info, department_profile)
+        needs_score = self._check_needs_alignment(grant_text, department_profile)
         score += needs_score * 0.30
         if needs_score > 0.5:
             reasons.append("Grant funding aligns with department needs")
@@ -94,7 +125,7 @@ class EligibilityChecker:
             match_details["budget_match"] = False
 
         # Check 5: 501(c)(3) Status
-        nonprofit_score = self._check_nonprofit_status(grant_info, department_profile)
+        nonprofit_score = self._check_nonprofit_status(grant_text, department_profile)
         score += nonprofit_score * 0.10
         if nonprofit_score > 0.5:
             reasons.append("Non-profit status verified")
@@ -118,35 +149,32 @@ class EligibilityChecker:
             match_details=match_details
         )
 
-        # Store in history
+        # Store in history. Record a raw nanosecond timestamp here - the
+        # ISO string is only needed if the history is read, so formatting
+        # is deferred to get_check_history
         self.check_history.append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
             "grant": grant_info.get("name", "Unknown"),
             "department": department_profile.get("name", "Unknown"),
             "eligible": is_eligible,
             "score": score
         })
 
-        logger.info(f"Eligibility check complete. Eligible: {is_eligible}, Score: {score:.2f}")
+        logger.info("Eligibility check complete. Eligible: %s, Score: %.2f", is_eligible, score)
         return result
 
     def _check_organization_type(
         self,
-        grant_info: Dict[str, Any],
+        grant_text: str,
         department_profile: Dict[str, Any]
     ) -> float:
         """Check if organization type matches grant requirements."""
         dept_type = department_profile.get("type", "").lower()
-        grant_desc = (grant_info.get("description", "") + " " + grant_info.get("name", "")).lower()
-
-        # Keywords that indicate volunteer eligibility
-        volunteer_keywords = ["volunteer", "combination", "all fire departments", "any fire department"]
-        paid_only_keywords = ["paid", "career", "full-time staff"]
 
         if dept_type == "volunteer":
             # Check if grant excludes volunteers
-            if any(keyword in grant_desc for keyword in paid_only_keywords):
-                if not any(keyword in grant_desc for keyword in volunteer_keywords):
+            if _PAID_ONLY_RE.search(grant_text):
+                if not _VOLUNTEER_RE.search(grant_text):
                     return 0.2  # Likely not eligible
             return 0.9  # Most grants accept volunteers
 
@@ -179,7 +207,7 @@ class EligibilityChecker:
         grant_text = f"{grant_name} {grant_source} {grant_desc}"
 
         # Federal grants (no geographic restriction)
-        if any(word in grant_text for word in ["federal", "fema", "national", "nationwide"]):
+        if _FEDERAL_RE.search(grant_text):
             return 1.0
 
         # Check if grant is state-specific by looking for state names in grant name/source
@@ -194,11 +222,11 @@ class EligibilityChecker:
         if states_in_grant:
             # Check if department's state matches any of the states in the grant
             if dept_state and dept_state in states_in_grant:
-                logger.info(f"Grant '{grant_info.get('name')}' matches department state '{dept_state}'")
+                logger.info("Grant '%s' matches department state '%s'", grant_info.get('name'), dept_state)
                 return 1.0
             else:
                 # Grant is from a different state - this is a poor match
-                logger.info(f"Grant '{grant_info.get('name')}' is from state(s) {states_in_grant}, but department is in '{dept_state}' - filtering out")
+                logger.info("Grant '%s' is from state(s) %s, but department is in '%s' - filtering out", grant_info.get('name'), states_in_grant, dept_state)
                 return 0.1  # Very low score for out-of-state grants
 
         # If no specific state mentioned in name/source, assume broadly eligible
@@ -206,17 +234,11 @@ class EligibilityChecker:
 
     def _check_needs_alignment(
         self,
-        grant_info: Dict[str, Any],
+        grant_text: str,
         department_profile: Dict[str, Any]
     ) -> float:
         """Check if grant funding aligns with department needs."""
         needs = [need.lower() for need in department_profile.get("needs", [])]
-        grant_desc = (grant_info.get("description", "") + " " + grant_info.get("name", "")).lower()
-
-        # Keywords for different types of grants
-        equipment_keywords = ["equipment", "apparatus", "vehicle", "scba", "gear", "aed", "extrication"]
-        training_keywords = ["training", "education", "certification", "professional development"]
-        facility_keywords = ["facility", "station", "building", "construction", "renovation"]
 
         matches = 0
         total_checks = len(needs)
@@ -226,20 +248,19 @@ class EligibilityChecker:
 
         for need in needs:
             # Check for direct keyword matches
-            if need in grant_desc:
+            if need in grant_text:
                 matches += 1
                 continue
 
-            # Check for category matches
-            need_lower = need.lower()
-            if any(keyword in need_lower for keyword in ["training", "certification", "education"]):
-                if any(keyword in grant_desc for keyword in training_keywords):
+            # Check for category matches (need is already lowercased)
+            if any(keyword in need for keyword in _TRAINING_NEED_HINTS):
+                if _TRAINING_RE.search(grant_text):
                     matches += 0.8
-            elif any(keyword in need_lower for keyword in ["equipment", "gear", "scba", "aed"]):
-                if any(keyword in grant_desc for keyword in equipment_keywords):
+            elif any(keyword in need for keyword in _EQUIPMENT_NEED_HINTS):
+                if _EQUIPMENT_RE.search(grant_text):
                     matches += 0.8
-            elif any(keyword in need_lower for keyword in ["facility", "station", "building"]):
-                if any(keyword in grant_desc for keyword in facility_keywords):
+            elif any(keyword in need for keyword in _FACILITY_NEED_HINTS):
+                if _FACILITY_RE.search(grant_text):
                     matches += 0.8
 
         return min(matches / total_checks, 1.0)
@@ -256,53 +277,69 @@ class EligibilityChecker:
         if not funding_range or dept_budget == 0:
             return 0.7  # Neutral if no data
 
-        # Extract numbers from funding range
-        numbers = re.findall(r'\$?[\d,]+', funding_range)
-        if numbers:
+        # Structured ranges (dict or [min, max] pair) skip the regex entirely
+        if isinstance(funding_range, dict):
+            min_funding = funding_range.get("min", 0)
+            max_funding = funding_range.get("max", 0)
+        elif isinstance(funding_range, (list, tuple)) and len(funding_range) == 2:
+            min_funding, max_funding = funding_range
+        else:
+            # Extract numbers from a free-text funding range
+            numbers = _FUNDING_AMOUNT_RE.findall(funding_range)
+            if not numbers:
+                return 0.6  # Default if can't parse
             try:
-                # Parse the funding amounts
-                amounts = [int(num.replace(',', '').replace('$', '')) for num in numbers]
-                min_funding = min(amounts) if amounts else 0
-                max_funding = max(amounts) if amounts else 0
-
-                # Check if department budget is within reasonable range
-                # Small departments should apply for smaller grants
-                if dept_budget < 100000:  # Small department
-                    if max_funding <= 100000:
-                        return 1.0  # Perfect match
-                    elif min_funding <= 50000:
-                        return 0.8  # Still good
-                elif dept_budget < 500000:  # Medium department
-                    if 10000 <= min_funding <= 500000:
-                        return 1.0
-                else:  # Large department
-                    if min_funding >= 50000:
-                        return 1.0
-
-            except (ValueError, IndexError):
-                pass
-
-        return 0.6  # Default if can't parse
+                amounts = [int(num.translate(_AMOUNT_STRIP)) for num in numbers]
+            except ValueError:
+                return 0.6  # Default if can't parse
+            min_funding = min(amounts)
+            max_funding = max(amounts)
+
+        # Check if department budget is within reasonable range
+        # Small departments should apply for smaller grants
+        if dept_budget < 100000:  # Small department
+            if max_funding <= 100000:
+                return 1.0  # Perfect match
+            elif min_funding <= 50000:
+                return 0.8  # Still good
+        elif dept_budget < 500000:  # Medium department
+            if 10000 <= min_funding <= 500000:
+                return 1.0
+        else:  # Large department
+            if min_funding >= 50000:
+                return 1.0
+
+        return 0.6  # Default
 
     def _check_nonprofit_status(
         self,
-        grant_info: Dict[str, Any],
+        grant_text: str,
         department_profile: Dict[str, Any]
     ) -> float:
         """Check if 501(c)(3) status matches grant requirements."""
         has_501c3 = department_profile.get("organization_details", {}).get("501c3_status", False)
-        grant_desc = (grant_info.get("description", "") + " " + grant_info.get("name", "")).lower()
 
         # Check if grant requires 501(c)(3)
-        if "501(c)(3)" in grant_desc or "nonprofit" in grant_desc:
+        if "501(c)(3)" in grant_text or "nonprofit" in grant_text:
             return 1.0 if has_501c3 else 0.3
 
         # Many fire department grants don't require 501(c)(3)
         return 0.9
 
     def get_check_history(self) -> List[Dict[str, Any]]:
-        """Get history of eligibility checks."""
-        return self.check_history
+        """Get history of eligibility checks, with ISO timestamps."""
+        history = []
+        for entry in self.check_history:
+            entry = dict(entry)
+            ns = entry.pop("timestamp_ns")
+            entry["timestamp"] = datetime.fromtimestamp(ns / 1e9).isoformat()
+            history.append(entry)
+        return history
+
+
+# Process-wide checker for the standalone helper - no need to allocate a
+# fresh checker (and history deque) per call. The deque bounds its growth.
+_DEFAULT_CHECKER = EligibilityChecker()
 
 
 # Standalone function for simple usage
@@ -320,6 +357,5 @@ def check_eligibility(
     Returns:
         True if eligible, False otherwise
     """
-    checker = EligibilityChecker()
-    result = checker.check_eligibility(grant_info, department_profile)
+    result = _DEFAULT_CHECKER.check_eligibility(grant_info, department_profile)
     return result.is_eligible
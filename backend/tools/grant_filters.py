@@ -3,6 +3,8 @@ Grant Filtering Logic - Pure utility functions for filtering and validating gran
 No ADK dependencies - these are pure Python functions
 """
 
+import re
+
 # US States list for filtering state-specific grants
 US_STATES = [
     "alabama", "alaska", "arizona", "arkansas", "california", "colorado",
@@ -38,101 +40,115 @@ STATE_ABBREVIATIONS = {
 }
 
 
+# ============================================================================
+# Precompiled matchers - one C-level regex scan per text instead of dozens of
+# Python-level substring probes per call. Longest alternatives first so
+# "west virginia" isn't reported as "virginia".
+# ============================================================================
+
+def _alternation(literals) -> "re.Pattern":
+    return re.compile("|".join(sorted((re.escape(lit) for lit in literals), key=len, reverse=True)))
+
+
+_STATE_RE = _alternation(US_STATES)
+
+# URL patterns like "ohio.gov", ".oh.gov", ".tx.us" -> canonical state name
+_URL_STATE_PATTERNS = {}
+for _state, _abbrev in STATE_ABBREVIATIONS.items():
+    _URL_STATE_PATTERNS[f"{_state}.gov"] = _state
+    _URL_STATE_PATTERNS[f".{_abbrev}.gov"] = _state
+    _URL_STATE_PATTERNS[f".{_abbrev}.us"] = _state
+_URL_STATE_RE = _alternation(_URL_STATE_PATTERNS)
+
+_FEDERAL_RE = _alternation(
+    ["federal", "fema", "national", "nationwide", "u.s.", "united states", "usda", "dhs"]
+)
+
+# Known national foundations that serve all states
+_NATIONAL_FOUNDATION_RE = _alternation([
+    "firehouse subs", "gary sinise", "leary firefighters", "spirit of blue",
+    "100 club", "nfff", "national fallen firefighters", "iafc", "nvfc",
+    "foundation", "national volunteer"  # generic foundation indicator
+])
+
+
 def is_federal_grant(grant_name: str, grant_source: str, grant_desc: str) -> bool:
     """Check if a grant is federal (available nationwide)."""
     text = f"{grant_name} {grant_source} {grant_desc}".lower()
-    federal_indicators = ["federal", "fema", "national", "nationwide", "u.s.", "united states", "usda", "dhs"]
-    return any(indicator in text for indicator in federal_indicators)
+    return _FEDERAL_RE.search(text) is not None
 
 
 def is_national_foundation_grant(grant_name: str, grant_source: str) -> bool:
     """Check if a grant is from a national foundation (available nationwide)."""
     text = f"{grant_name} {grant_source}".lower()
-    # Known national foundations that serve all states
-    national_foundations = [
-        "firehouse subs", "gary sinise", "leary firefighters", "spirit of blue",
-        "100 club", "nfff", "national fallen firefighters", "iafc", "nvfc",
-        "foundation", "national volunteer"  # generic foundation indicator
-    ]
-    return any(foundation in text for foundation in national_foundations)
+    return _NATIONAL_FOUNDATION_RE.search(text) is not None
 
 
 def get_grant_states(grant_name: str, grant_source: str, grant_url: str = "") -> list:
     """Extract state names from grant name, source, or URL."""
     text = f"{grant_name} {grant_source}".lower()
-    found_states = []
-    
-    # Check name and source for state names
-    for state in US_STATES:
-        if state in text:
-            found_states.append(state)
-    
+
+    # Check name and source for state names (deduped, order preserved)
+    found_states = list(dict.fromkeys(_STATE_RE.findall(text)))
+
     # Also check URL for state abbreviations or domains
     # e.g., ohio.gov, nc.gov, state.tx.us, etc.
     if grant_url:
-        url_lower = grant_url.lower()
-        
-        for state_name, abbrev in STATE_ABBREVIATIONS.items():
-            # Check for patterns like "ohio.gov", ".oh.us", "state.oh."
-            if f"{state_name}.gov" in url_lower or f".{abbrev}.gov" in url_lower or f".{abbrev}.us" in url_lower:
-                if state_name not in found_states:
-                    found_states.append(state_name)
-    
+        for match in _URL_STATE_RE.findall(grant_url.lower()):
+            state_name = _URL_STATE_PATTERNS[match]
+            if state_name not in found_states:
+                found_states.append(state_name)
+
     return found_states
 
 
+def _keep_grant(grant: dict, dept_state_lower: str) -> bool:
+    """Decide whether a single grant survives state filtering."""
+    get = grant.get
+    grant_name = get("name", "")
+    grant_source = get("source", "")
+
+    # Always include federal grants
+    if is_federal_grant(grant_name, grant_source, get("description", "")):
+        return True
+
+    # Always include national foundation grants
+    if is_national_foundation_grant(grant_name, grant_source):
+        return True
+
+    # Check if grant is state-specific - scan the name/source and the URL
+    # exactly once each
+    name_states = get_grant_states(grant_name, grant_source)
+    url_states = get_grant_states("", "", get("url", ""))
+
+    # No state in grant name/source/URL - assume it's broadly available
+    if not name_states and not url_states:
+        return True
+
+    # If multiple states detected (e.g., "NC" in name but "ohio.gov" in URL),
+    # this is likely a data error - be conservative and check if ANY state matches
+    # But if URL indicates a different state than name, trust the URL more
+    # If URL indicates a state that conflicts with name, it's probably bad data
+    if url_states and name_states and not any(s in url_states for s in name_states):
+        return False
+
+    # Grant is state-specific - only include if department is in that state
+    return dept_state_lower in name_states or dept_state_lower in url_states
+
+
 def filter_grants_by_state(grants: list, department_state: str) -> list:
     """
     Filter out grants that are specific to other states.
-    
+
     Args:
         grants: List of grant objects
         department_state: The state where the department is located (lowercase)
-    
+
     Returns:
         Filtered list of grants that are either federal or match the department's state
     """
     if not department_state:
         return grants
-    
+
     dept_state_lower = department_state.lower()
-    filtered_grants = []
-    
-    for grant in grants:
-        grant_name = grant.get("name", "")
-        grant_source = grant.get("source", "")
-        grant_desc = grant.get("description", "")
-        grant_url = grant.get("url", "")
-        
-        # Always include federal grants
-        if is_federal_grant(grant_name, grant_source, grant_desc):
-            filtered_grants.append(grant)
-            continue
-        
-        # Always include national foundation grants
-        if is_national_foundation_grant(grant_name, grant_source):
-            filtered_grants.append(grant)
-            continue
-        
-        # Check if grant is state-specific (check name, source, AND URL)
-        grant_states = get_grant_states(grant_name, grant_source, grant_url)
-        
-        if grant_states:
-            # If multiple states detected (e.g., "NC" in name but "ohio.gov" in URL),
-            # this is likely a data error - be conservative and check if ANY state matches
-            # But if URL indicates a different state than name, trust the URL more
-            url_states = get_grant_states("", "", grant_url)
-            name_states = get_grant_states(grant_name, grant_source, "")
-            
-            # If URL indicates a state that conflicts with name, it's probably bad data
-            if url_states and name_states and not any(s in url_states for s in name_states):
-                continue
-            
-            # Grant is state-specific - only include if department is in that state
-            if dept_state_lower in grant_states:
-                filtered_grants.append(grant)
-        else:
-            # No state in grant name/source - assume it's broadly available
-            filtered_grants.append(grant)
-    
-    return filtered_grants
+    return [grant for grant in grants if _keep_grant(grant, dept_state_lower)]
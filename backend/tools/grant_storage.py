@@ -7,6 +7,15 @@ from tools.grant_filters import filter_grants_by_state
 
 logger = logging.getLogger(__name__)
 
+# Reused decoder - raw_decode lets us parse the grant array directly from the
+# LLM output without a regex scan or an intermediate substring copy
+_DECODER = json.JSONDecoder()
+
+# Sanity bounds for LLM-supplied payloads: reject runaway JSON before
+# building its object graph, and cap how many grants we keep
+_MAX_PAYLOAD_BYTES = 2_000_000
+_MAX_GRANTS = 200
+
 
 def save_grants_to_state(tool_context: ToolContext, grants_json: str):
     """
@@ -18,9 +27,36 @@ def save_grants_to_state(tool_context: ToolContext, grants_json: str):
                      Each grant should have: name, source, url, description,
                      funding_range, eligibility_score, match_reasons, priority_rank
     """
+    if len(grants_json) > _MAX_PAYLOAD_BYTES:
+        logger.error("Grants payload too large: %d chars", len(grants_json))
+        return "Error: grants_json payload too large to process."
+
     try:
-        grants = json.loads(grants_json)
-        
+        # Seed the decoder at the first '[' so stray prose or markdown fences
+        # around the array don't break parsing
+        start = grants_json.find('[')
+        if start < 0:
+            raise json.JSONDecodeError("No JSON array found", grants_json, 0)
+        grants, _ = _DECODER.raw_decode(grants_json, start)
+
+        # Drop duplicates first - the LLM often repeats grants it saw in
+        # multiple searches, and every duplicate costs filter work and
+        # frontend rendering
+        seen = set()
+        unique_grants = []
+        for grant in grants:
+            key = (grant.get("name", ""), grant.get("source", ""), grant.get("url", ""))
+            if key not in seen:
+                seen.add(key)
+                unique_grants.append(grant)
+        if len(unique_grants) < len(grants):
+            logger.info("Dropped %d duplicate grants", len(grants) - len(unique_grants))
+        grants = unique_grants
+
+        if len(grants) > _MAX_GRANTS:
+            logger.warning("Truncating grants list from %d to %d", len(grants), _MAX_GRANTS)
+            grants = grants[:_MAX_GRANTS]
+
         # Get the department's state from the profile
         profile = tool_context.state.get("civic_grant_profile", {})
         dept_state = profile.get("location", {}).get("state", "")
@@ -42,4 +78,3 @@ def save_grants_to_state(tool_context: ToolContext, grants_json: str):
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse grants JSON: {e}")
         return f"Error: Invalid JSON format - {e}"
-        return f"Error: Invalid JSON format - {e}"
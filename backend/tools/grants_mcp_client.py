@@ -10,41 +10,77 @@ Environment Variables:
 - GRANTS_MCP_URL: MCP server endpoint (default: http://localhost:8081/mcp)
 """
 
+import atexit
+import json
 import os
 import logging
+import threading
+import time
 import httpx
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Shared client so back-to-back MCP calls reuse the pooled connection
+# instead of paying a TCP(+TLS) handshake per tool invocation
+_CLIENT = httpx.Client(
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=8),
+)
+atexit.register(_CLIENT.close)
+
+# Short-TTL response cache: the finder often repeats identical queries
+# across turns (and grant listings barely change within minutes), so a
+# hit skips the full MCP round trip. Error responses are never cached.
+_CACHE_TTL = 900.0  # seconds
+_CACHE_MAX = 256
+_cache: dict = {}
+_cache_lock = threading.Lock()
+
 
 def _call_grants_mcp(method: str, params: dict) -> dict:
     """Make a JSON-RPC call to the Grants-MCP server."""
     url = os.getenv("GRANTS_MCP_URL", "http://localhost:8081/mcp")
-    
+
+    cache_key = (url, method, json.dumps(params, sort_keys=True))
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _cache.get(cache_key)
+        if cached is not None and now - cached[0] < _CACHE_TTL:
+            logger.debug("MCP cache hit for %s", method)
+            return cached[1]
+
     logger.debug(f"Calling {url} - {method}")
-    
+
     payload = {
         "jsonrpc": "2.0",
         "method": method,
         "params": params,
         "id": 1
     }
-    
+
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(
-                url,
-                json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json, text/event-stream"
-                }
-            )
-            response.raise_for_status()
-            result = response.json()
-            logger.debug("MCP response received")
-            return result
+        response = _CLIENT.post(
+            url,
+            json=payload,
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json, text/event-stream"
+            }
+        )
+        response.raise_for_status()
+        result = response.json()
+        logger.debug("MCP response received")
+        # Only cache successful responses - JSON-RPC reports failures as a
+        # 200 body with an "error" key, and pinning one for the TTL would
+        # replay it long after the server recovers
+        if "error" not in result and result.get("result") is not None:
+            with _cache_lock:
+                if len(_cache) >= _CACHE_MAX:
+                    # Drop the oldest entry (insertion order == age here)
+                    _cache.pop(next(iter(_cache)), None)
+                _cache[cache_key] = (time.monotonic(), result)
+        return result
     except httpx.ConnectError as e:
         logger.error(f"MCP connection failed: {e}")
         return {"error": f"Failed to connect to Grants-MCP server at {url}: {str(e)}"}
@@ -97,13 +133,12 @@ def search_federal_grants(
             return "No grant opportunities found for your search query."
         
         # Extract text content from the response
-        formatted = []
-        for item in content:
-            if isinstance(item, dict) and item.get("type") == "text":
-                formatted.append(item.get("text", ""))
-            elif isinstance(item, str):
-                formatted.append(item)
-        
+        formatted = [
+            item.get("text", "") if isinstance(item, dict) else item
+            for item in content
+            if (isinstance(item, dict) and item.get("type") == "text") or isinstance(item, str)
+        ]
+
         return "\n".join(formatted) if formatted else "No results parsed from response."
         
     except Exception as e:
@@ -146,10 +181,10 @@ def get_agency_landscape(
     
     try:
         content = result.get("result", {}).get("content", [])
-        formatted = []
-        for item in content:
-            if isinstance(item, dict) and item.get("type") == "text":
-                formatted.append(item.get("text", ""))
+        formatted = [
+            item.get("text", "") for item in content
+            if isinstance(item, dict) and item.get("type") == "text"
+        ]
         return "\n".join(formatted) if formatted else "No agency data available."
     except Exception as e:
         return f"Error parsing response: {str(e)}"
@@ -194,10 +229,10 @@ def get_funding_trends(
     
     try:
         content = result.get("result", {}).get("content", [])
-        formatted = []
-        for item in content:
-            if isinstance(item, dict) and item.get("type") == "text":
-                formatted.append(item.get("text", ""))
+        formatted = [
+            item.get("text", "") for item in content
+            if isinstance(item, dict) and item.get("type") == "text"
+        ]
         return "\n".join(formatted) if formatted else "No trend data available."
     except Exception as e:
         return f"Error parsing response: {str(e)}"
@@ -6,14 +6,51 @@ from google.adk.tools.tool_context import ToolContext
 logger = logging.getLogger(__name__)
 
 
+def _merge_into(dst: dict, src: dict) -> None:
+    """Merge src into dst, mutating dst in place.
+
+    Iterative with an explicit stack - profiles nest a few levels deep
+    (location, organization_details, service_stats) and this avoids a
+    Python call frame per level.
+    """
+    stack = [(dst, src)]
+    while stack:
+        d, s = stack.pop()
+        for key, value in s.items():
+            # New keys (the common case for incremental LLM updates) are
+            # plain assignments - no type checks, no recursion
+            if key not in d:
+                d[key] = value
+                continue
+            existing = d[key]
+            if type(existing) is dict and type(value) is dict:
+                stack.append((existing, value))
+            else:
+                d[key] = value
+
+
 def deep_merge(base: dict, updates: dict) -> dict:
-    """Recursively merge updates into base dict."""
-    result = base.copy()
+    """Merge updates into a shallow copy of base.
+
+    Only the root dict is copied; nested dicts are merged in place. Callers
+    here own both sides (profile state and throwaway LLM payloads), so the
+    per-level copies the old recursive version made were pure churn.
+    """
+    # Nothing to merge - exit_profile_loop explicitly allows an empty
+    # payload, so don't even copy the root
+    if not updates:
+        return base
+
+    # Fast path: when no key needs a nested-dict merge, PEP 584's C-level
+    # single-pass merge beats the Python-level recursion
     for key, value in updates.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+        if type(value) is dict and type(base.get(key)) is dict:
+            break
+    else:
+        return base | updates
+
+    result = base.copy()
+    _merge_into(result, updates)
     return result
 
 
@@ -21,17 +58,27 @@ def updateDepartmentProfile(tool_context: ToolContext, profileData: dict):
     """
     Update the department profile with new information.
     """
-    # 1. Get current profile from state
-    raw_profile = tool_context.state.get("civic_grant_profile", {})
-    if not isinstance(raw_profile, dict): 
+    # 1. Get current profile from state (bind state once - it may be backed
+    # by a session store, not a plain dict)
+    state = tool_context.state
+    # No eager {} default - the isinstance guard below already covers the
+    # missing-key (None) case
+    raw_profile = state.get("civic_grant_profile")
+    if not isinstance(raw_profile, dict):
         raw_profile = {}
-    
-    # 2. Deep merge the new data into existing profile
+
+    # 2. Skip the merge and the AG-UI sync write when nothing changes - the
+    # prompt asks the LLM to re-send the complete profile before exiting, so
+    # the final call is often a byte-for-byte repeat
+    if raw_profile and all(raw_profile.get(key) == value for key, value in profileData.items()):
+        return "Profile updated successfully."
+
+    # 3. Deep merge the new data into existing profile
     current_profile = deep_merge(raw_profile, profileData)
 
-    # 3. Save to State - use tool_context.state for AG-UI sync
-    tool_context.state["civic_grant_profile"] = current_profile
-    
+    # 4. Save to State - use tool_context.state for AG-UI sync
+    state["civic_grant_profile"] = current_profile
+
     return "Profile updated successfully."
 
 
@@ -44,26 +91,33 @@ def exit_profile_loop(tool_context: ToolContext, final_profile_data: dict):
         final_profile_data: Optional final profile data to merge. Can be empty dict {}.
     """
     # Get existing profile - DON'T overwrite it!
-    existing_profile = tool_context.state.get("civic_grant_profile", {})
+    state = tool_context.state
+    existing_profile = state.get("civic_grant_profile")
     if not isinstance(existing_profile, dict):
         existing_profile = {}
-    
-    # Only merge if final_profile_data has content (not empty dict)
-    if final_profile_data and isinstance(final_profile_data, dict) and len(final_profile_data) > 0:
-        existing_profile = deep_merge(existing_profile, final_profile_data)
-    
-    # Save merged profile back
-    tool_context.state["civic_grant_profile"] = existing_profile
-    tool_context.state["profile_complete"] = True
-    tool_context.state["workflow_step"] = "grant_scouting"
+
+    # Only merge (and re-write the profile) if final_profile_data has
+    # content - the prompt explicitly allows passing {}, and a no-op write
+    # would still trigger an AG-UI state sync. final_profile_data is a
+    # throwaway LLM payload, so merge straight into the existing profile
+    # instead of building a copy first.
+    if final_profile_data and isinstance(final_profile_data, dict):
+        _merge_into(existing_profile, final_profile_data)
+        state["civic_grant_profile"] = existing_profile
+
+    state["profile_complete"] = True
+    state["workflow_step"] = "grant_scouting"
     
     return "Profile completed! Tell the user their profile is complete and ask them to say 'find grants' or 'search for grants' to start searching for matching grant opportunities."
 
 
 def on_before_agent(callback_context):
     """Initialize civic_grant_profile state if it doesn't exist."""
-    if "civic_grant_profile" not in callback_context.state:
-        callback_context.state["civic_grant_profile"] = {}
-    if "profile_complete" not in callback_context.state:
-        callback_context.state["profile_complete"] = False
+    # ADK's State wrapper doesn't guarantee the full MutableMapping API
+    # (no setdefault), so membership checks stay - but on one bound local
+    state = callback_context.state
+    if "civic_grant_profile" not in state:
+        state["civic_grant_profile"] = {}
+    if "profile_complete" not in state:
+        state["profile_complete"] = False
     return None
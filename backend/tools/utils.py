@@ -9,13 +9,14 @@ def deep_update(source, overrides):
     Does not delete existing keys in 'source' unless 'overrides' explicitly replaces them.
     """
     for key, value in overrides.items():
-        if isinstance(value, dict) and value:
-            # If the key exists in source and is a dict, recurse
-            node = source.setdefault(key, {})
-            if isinstance(node, dict):
+        # Exact type check - profile data is plain dicts, and `type is` is a
+        # single pointer compare vs isinstance's mro walk
+        if type(value) is dict and value:
+            node = source.get(key)
+            if type(node) is dict:
                 deep_update(node, value)
             else:
-                # If source[key] was not a dict (e.g. a string), overwrite it
+                # Missing, or not a dict (e.g. a string) - overwrite it
                 source[key] = value
         else:
             # If value is not a dict (string, int, list), overwrite
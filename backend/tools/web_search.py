@@ -1,10 +1,51 @@
 import os
 import logging
+import threading
+import time
+from functools import lru_cache
+
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 logger = logging.getLogger(__name__)
 
+# TTL cache for search results keyed by normalized query - repeated
+# identical searches (re-prompted departments, model retries) are common
+# and CSE calls are rate-limited and billable. Errors are never cached.
+_CACHE_TTL = 3600.0  # seconds
+_CACHE_MAX = 256
+_cache: dict = {}
+_cache_lock = threading.Lock()
+
+# Read once at import - app.py calls load_dotenv() before importing the
+# agent tree, and these are immutable for the process lifetime
+_API_KEY = os.getenv("GOOGLE_SEARCH_API_KEY")
+_CSE_ID = os.getenv("GOOGLE_SEARCH_ENGINE_ID")
+_REFERER = os.getenv("BACKEND_URL")
+
+
+@lru_cache(maxsize=4)
+def _get_service(api_key: str):
+    """Build the Custom Search service once per API key.
+
+    build() parses the discovery document on every call - by far the most
+    expensive part of a search after the HTTP round trip itself, and the
+    result is reusable for the process lifetime.
+
+    static_discovery=True uses the schema vendored with
+    google-api-python-client instead of fetching the discovery doc over
+    HTTP, so a cold worker skips a network round trip before its first
+    search. Tradeoff: the schema tracks the installed library version,
+    which is fine for the pinned >=2.x client.
+    """
+    return build(
+        "customsearch",
+        "v1",
+        developerKey=api_key,
+        cache_discovery=False,
+        static_discovery=True,
+    )
+
 # ============================================================================
 # TOOL: Google Custom Search (Wrapper)
 # Required to avoid tool mixing issues with the LLM
@@ -17,42 +58,50 @@ def search_web(query: str) -> str:
     Args:
         query: The search query string (e.g., "Morningslide Fire Department population")
     """
+    cache_key = query.strip().lower()
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _cache.get(cache_key)
+        if cached is not None and now - cached[0] < _CACHE_TTL:
+            logger.debug("Search cache hit for %r", cache_key)
+            return cached[1]
+
     try:
-        # Get credentials from environment variables
-        api_key = os.getenv("GOOGLE_SEARCH_API_KEY")
-        cse_id = os.getenv("GOOGLE_SEARCH_ENGINE_ID")
-        
-        if not api_key or not cse_id:
+        if not _API_KEY or not _CSE_ID:
             logger.error("Missing Google Search API credentials")
             return "Error: Google Search API credentials not configured."
 
-        # Build the Custom Search service
-        service = build("customsearch", "v1", developerKey=api_key)
-        
+        # Get the (cached) Custom Search service
+        service = _get_service(_API_KEY)
+
         # Create the request
-        req = service.cse().list(q=query, cx=cse_id, num=3)
-        
+        req = service.cse().list(q=query, cx=_CSE_ID, num=3)
+
         # Add Referer header for API key restrictions
-        referer = os.getenv("BACKEND_URL")
-        if referer:
-            req.headers["Referer"] = referer
+        if _REFERER:
+            req.headers["Referer"] = _REFERER
         
         # Execute the search
         res = req.execute()
         
         items = res.get('items', [])
         if not items:
-            return "Search completed, but no relevant results were found."
-            
-        # Format the results for the LLM
-        formatted_results = []
-        for item in items:
-            title = item.get('title', 'No Title')
-            snippet = item.get('snippet', 'No snippet')
-            link = item.get('link', 'No link')
-            formatted_results.append(f"Title: {title}\nSnippet: {snippet}\nLink: {link}\n---")
-            
-        return "\n".join(formatted_results)
+            result = "Search completed, but no relevant results were found."
+        else:
+            # Format the results for the LLM - single pass, no intermediate list
+            result = "\n".join(
+                f"Title: {item.get('title', 'No Title')}\n"
+                f"Snippet: {item.get('snippet', 'No snippet')}\n"
+                f"Link: {item.get('link', 'No link')}\n---"
+                for item in items
+            )
+
+        with _cache_lock:
+            if len(_cache) >= _CACHE_MAX:
+                # Drop the oldest entry (insertion order == age here)
+                _cache.pop(next(iter(_cache)), None)
+            _cache[cache_key] = (time.monotonic(), result)
+        return result
 
     except HttpError as e:
         logger.error(f"Google Search API error: {e}")